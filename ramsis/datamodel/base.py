@@ -8,6 +8,7 @@ import functools
 
 from sqlalchemy import Column, Boolean, Integer, Float, String, DateTime
 from sqlalchemy.ext.declarative import declared_attr, declarative_base
+from sqlalchemy.orm import class_mapper
 
 
 class Base(object):
@@ -22,6 +23,81 @@ class Base(object):
 ORMBase = declarative_base(cls=Base)
 
 
+@functools.lru_cache(maxsize=None)
+def mapper_keys(cls):
+    """
+    Return the primary key, relationship and foreign key attribute keys of a
+    mapped class.
+
+    Since mapper introspection is expensive, results are cached per class.
+
+    :param cls: Mapped class
+    :returns: Tuple of primary key, relationship and foreign key attribute
+        keys
+    :rtype: tuple of frozenset
+    """
+    mapper = class_mapper(cls)
+
+    pk_keys = frozenset(c.key for c in mapper.primary_key)
+    rel_keys = frozenset(c.key for c in mapper.relationships)
+    fk_keys = frozenset(c.key for c in mapper.columns if c.foreign_keys)
+
+    return pk_keys, rel_keys, fk_keys
+
+
+@functools.lru_cache(maxsize=None)
+def comparable_attrs(cls):
+    """
+    Return the keys of those attributes of a mapped class which are relevant
+    when comparing instances by value. Primary keys, foreign keys and
+    relationships are omitted.
+
+    :param cls: Mapped class
+    :returns: Attribute keys
+    :rtype: tuple
+    """
+    pk_keys, rel_keys, fk_keys = mapper_keys(cls)
+    omit = pk_keys | rel_keys | fk_keys
+
+    return tuple(p.key for p in class_mapper(cls).iterate_properties
+                 if p.key not in omit)
+
+
+@functools.lru_cache(maxsize=None)
+def copyable_attrs(cls, with_foreignkeys=False):
+    """
+    Return the keys of those attributes of a mapped class which are copied
+    when copying instances. Primary keys and relationships are omitted.
+
+    :param cls: Mapped class
+    :param bool with_foreignkeys: Include foreign keys
+
+    :returns: Attribute keys
+    :rtype: tuple
+    """
+    pk_keys, rel_keys, fk_keys = mapper_keys(cls)
+    omit = pk_keys | rel_keys
+    if not with_foreignkeys:
+        omit |= fk_keys
+
+    return tuple(p.key for p in class_mapper(cls).iterate_properties
+                 if p.key not in omit)
+
+
+class ComparableByValueMixin(object):
+    """
+    Mixin for mapped classes whose instances compare equal if their
+    :py:func:`comparable_attrs` are equal.
+    """
+
+    def __eq__(self, other):
+        if not isinstance(other, type(self)):
+            return NotImplemented
+
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in comparable_attrs(type(self)))
+
+
 # ----------------------------------------------------------------------------
 # XXX(damb): Within the mixins below the QML type *ResourceReference* (i.e. an
 # URI) is implemented as sqlalchemy.String
@@ -4,7 +4,7 @@ Forecast related ORM facilities.
 """
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Column, Boolean, Enum, Integer, ForeignKey
+from sqlalchemy import Column, Boolean, Enum, Integer, ForeignKey, Index
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
@@ -27,7 +27,8 @@ class Forecast(CreationInfoMixin,
     :py:class:`SeismicCatalog` and :py:class:`InjectionWell`.
     """
     # relation: Project
-    project_id = Column(Integer, ForeignKey('project.id'))
+    project_id = Column(Integer, ForeignKey('project.id',
+                                            ondelete='CASCADE'))
     project = relationship('Project', back_populates='forecasts')
     # XXX(damb): Catalogs used for a forecast are snapshots. Thus, a
     # delete-orphan is appropriate.
@@ -42,13 +43,15 @@ class Forecast(CreationInfoMixin,
                              back_populates='forecast',
                              cascade='all, delete-orphan')
 
+    __table_args__ = (
+        Index('ix_forecast_project_id_starttime', 'project_id', 'starttime'), )
+
     @hybrid_property
     def duration(self):
         return self.endtime - self.starttime
 
     def __iter__(self):
-        for s in self.scenarios:
-            yield s
+        return iter(self.scenarios)
 
 
 class ForecastScenario(NameMixin, ORMBase):
@@ -72,11 +75,13 @@ class ForecastScenario(NameMixin, ORMBase):
 
     reservoirgeom = Column(Geometry(geometry_type='GEOMETRYZ',
                                     dimension=3,
-                                    management=True),
+                                    management=True,
+                                    spatial_index=True),
                            nullable=False)
 
     # relation: Forecast
-    forecast_id = Column(Integer, ForeignKey('forecast.id'))
+    forecast_id = Column(Integer, ForeignKey('forecast.id',
+                                             ondelete='CASCADE'))
     forecast = relationship('Forecast', back_populates='scenarios')
     # relation: InjectionWell
     well = relationship('InjectionWell',
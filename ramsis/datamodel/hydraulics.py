@@ -4,10 +4,11 @@ Hydraulics related ORM facilities.
 """
 
 from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship, class_mapper
+from sqlalchemy.orm import relationship
 
 from ramsis.datamodel.base import (ORMBase, CreationInfoMixin,
-                                   RealQuantityMixin, TimeQuantityMixin)
+                                   ComparableByValueMixin, RealQuantityMixin,
+                                   TimeQuantityMixin, comparable_attrs)
 
 # NOTE(damb): Currently, basically both Hydraulics and InjectionPlan implement
 # the same facilities i.e. a timeseries of hydraulics data shipping some
@@ -26,12 +27,12 @@ class Hydraulics(CreationInfoMixin, ORMBase):
                            cascade='all, delete-orphan')
 
     # relation: WellSection
-    wellsection_id = Column(Integer, ForeignKey('wellsection.id'))
+    wellsection_id = Column(Integer, ForeignKey('wellsection.id',
+                                                ondelete='CASCADE'))
     wellsection = relationship('WellSection', back_populates='hydraulics')
 
     def __iter__(self):
-        for s in self.samples:
-            yield s
+        return iter(self.samples)
 
     def __getitem__(self, item):
         return self.samples[item] if self.samples else None
@@ -63,12 +64,12 @@ class InjectionPlan(CreationInfoMixin, ORMBase):
                            single_parent=True,
                            cascade='all, delete-orphan')
     # relation: WellSection
-    wellsection_id = Column(Integer, ForeignKey('wellsection.id'))
+    wellsection_id = Column(Integer, ForeignKey('wellsection.id',
+                                                ondelete='CASCADE'))
     wellsection = relationship('WellSection', back_populates='injectionplan')
 
     def __iter__(self):
-        for s in self.samples:
-            yield s
+        return iter(self.samples)
 
     def __getitem__(self, item):
         return self.samples[item] if self.samples else None
@@ -79,7 +80,8 @@ class InjectionPlan(CreationInfoMixin, ORMBase):
             len(self.samples))
 
 
-class HydraulicSample(TimeQuantityMixin('datetime'),
+class HydraulicSample(ComparableByValueMixin,
+                      TimeQuantityMixin('datetime'),
                       RealQuantityMixin('bottomtemperature', optional=True),
                       RealQuantityMixin('bottomflow', optional=True),
                       RealQuantityMixin('bottompressure', optional=True),
@@ -103,43 +105,71 @@ class HydraulicSample(TimeQuantityMixin('datetime'),
 
     # relation: Hydraulics
     hydraulics_id = Column(Integer,
-                           ForeignKey('hydraulics.id'))
+                           ForeignKey('hydraulics.id',
+                                      ondelete='CASCADE'))
     hydraulics = relationship('Hydraulics',
                               back_populates='samples')
     # relation: InjectionPlan
     injectionplan_id = Column(Integer,
-                              ForeignKey('injectionplan.id'))
+                              ForeignKey('injectionplan.id',
+                                         ondelete='CASCADE'))
     injectionplan = relationship('InjectionPlan',
                                  back_populates='samples')
 
-    # TODO(damb): Is using functools.total_ordering an option?
-    def __eq__(self, other):
-        if isinstance(other, HydraulicSample):
-            mapper = class_mapper(type(self))
-
-            pk_keys = set([c.key for c in mapper.primary_key])
-            rel_keys = set([c.key for c in mapper.relationships])
-            fk_keys = set([c.key for c in mapper.columns if c.foreign_keys])
-
-            omit = pk_keys | rel_keys | fk_keys
-
-            return all(getattr(self, attr) == getattr(other, attr)
-                       for attr in [p.key for p in mapper.iterate_properties
-                                    if p.key not in omit])
-
-        raise ValueError
-
-    def __ne__(self, other):
-        return not self.__eq__(other)
+    @classmethod
+    def bulk_create(cls, session, samples, hydraulics=None,
+                    injectionplan=None):
+        """
+        Persist hydraulic samples in bulk bypassing the session's unit of
+        work. Samples are passed as mappings of attribute keys to values,
+        i.e. no ORM instances are constructed.
+
+        :param session: Session used for persisting the samples
+        :type session: :py:class:`sqlalchemy.orm.session.Session`
+        :param samples: Hydraulic samples
+        :type samples: iterable of dict
+        :param hydraulics: Hydraulics the samples are assigned to
+        :type hydraulics: :py:class:`Hydraulics` or None
+        :param injectionplan: Injection plan the samples are assigned to
+        :type injectionplan: :py:class:`InjectionPlan` or None
+
+        :raises ValueError: If `hydraulics` or `injectionplan` is not attached
+            to `session`
+
+        .. note::
+
+            Bulk operations bypass relationship handling. Hence, the
+            :code:`samples` collections of `hydraulics` and `injectionplan`
+            are expired.
+        """
+        parents = [p for p in (hydraulics, injectionplan) if p is not None]
+        # XXX(damb): Validate parents before inserting anything; samples of
+        # detached parents would be inserted without foreign keys.
+        if any(p not in session for p in parents):
+            raise ValueError('Parents must be attached to the session.')
+        if any(p.id is None for p in parents):
+            session.flush()
+
+        fks = {}
+        if hydraulics is not None:
+            fks['hydraulics_id'] = hydraulics.id
+        if injectionplan is not None:
+            fks['injectionplan_id'] = injectionplan.id
+
+        session.bulk_insert_mappings(cls, [dict(s, **fks) for s in samples])
+
+        for p in parents:
+            session.expire(p, ['samples'])
 
     def __str__(self):
         return "<{}(datetime={})>".format(type(self).__name__,
                                           self.datetime_value.isoformat())
 
-    # TODO(damb)
-    # https://docs.python.org/3/reference/datamodel.html#object.__hash__
-    # recommends to mix together the hash values of the components of the
-    # object that also play a role in comparison of objects by packing them
-    # into a tuple and hashing the tuple
+    # XXX(damb): Following
+    # https://docs.python.org/3/reference/datamodel.html#object.__hash__ the
+    # hash values of the components of the object that also play a role in
+    # comparison of objects are mixed together by packing them into a tuple.
+    # Note, that modifying a sample changes its hash value.
     def __hash__(self):
-        return id(self)
+        return hash(tuple(getattr(self, attr)
+                          for attr in comparable_attrs(type(self))))
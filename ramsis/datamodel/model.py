@@ -29,7 +29,8 @@ class Model(NameMixin, ORMBase):
         Inheritance is implemented following the `SQLAlchemy Joined Table
         Inheritance
         <https://docs.sqlalchemy.org/en/latest/orm/inheritance.html#joined-table-inheritance>`_
-        paradigm.
+        paradigm. Subclass tables are loaded eagerly by means of a single
+        JOIN (:code:`with_polymorphic='*'`).
     """
     # XXX(damb): default model configuration parameters
     config = Column(MutableDict.as_mutable(JSONEncodedDict))
@@ -39,6 +40,7 @@ class Model(NameMixin, ORMBase):
     __mapper_args__ = {
         'polymorphic_identity': 'model',
         'polymorphic_on': _type,
+        'with_polymorphic': '*',
     }
 
 
@@ -51,7 +53,8 @@ class ModelRun(ORMBase):
         Inheritance is implemented following the `SQLAlchemy Joined Table
         Inheritance
         <https://docs.sqlalchemy.org/en/latest/orm/inheritance.html#joined-table-inheritance>`_
-        paradigm.
+        paradigm. Subclass tables are loaded eagerly by means of a single
+        JOIN (:code:`with_polymorphic='*'`).
     """
     # XXX(damb): seismicity model run specific configuration parameters
     config = Column(MutableDict.as_mutable(JSONEncodedDict))
@@ -66,4 +69,5 @@ class ModelRun(ORMBase):
     __mapper_args__ = {
         'polymorphic_identity': 'model_run',
         'polymorphic_on': _type,
+        'with_polymorphic': '*',
     }
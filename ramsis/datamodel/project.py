@@ -5,22 +5,33 @@ Project related ORM facilities.
 
 from geoalchemy2 import Geometry
 from sqlalchemy import Column, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, raiseload, selectinload
 
 from ramsis.datamodel.base import (ORMBase, CreationInfoMixin, NameMixin,
                                    UniqueOpenEpochMixin)
+from ramsis.datamodel.well import InjectionWell, WellSection
 
 
 class Project(CreationInfoMixin, NameMixin, UniqueOpenEpochMixin, ORMBase):
     """
     RT-RAMSIS project ORM representation. :py:class:`Project` is the root
     object of the RT-RAMSIS data model.
+
+    .. note::
+
+        Deleting a project relies on the database enforcing foreign key
+        constraints (i.e. :code:`ON DELETE CASCADE`). SQLite enforces foreign
+        keys only after :code:`PRAGMA foreign_keys=ON` was issued on the
+        connection. Children removed from a project's collections are
+        detached, only; delete them explicitly by means of
+        :py:meth:`sqlalchemy.orm.session.Session.delete`.
     """
     description = Column(String)
     referencepoint = Column(Geometry(geometry_type='POINTZ',
                                      dimension=3,
                                      srid=4326,
-                                     management=True),
+                                     management=True,
+                                     spatial_index=True),
                             nullable=False)
     # XXX(damb): Spatial reference system in Proj4 notation representing the
     # local coordinate system;
@@ -28,12 +39,48 @@ class Project(CreationInfoMixin, NameMixin, UniqueOpenEpochMixin, ORMBase):
     spatialreference = Column(String, nullable=False)
 
     # relationships
+    # XXX(damb): Project children are virtually always accessed together;
+    # load them by means of a single SELECT ... IN per relationship. Deleting
+    # a project is left entirely to the database (ON DELETE CASCADE); the ORM
+    # neither deletes loaded children one by one nor nulls out their foreign
+    # keys (passive_deletes='all'). Children removed from a collection are
+    # detached from the project, only.
     relationship_config = {'back_populates': 'project',
-                           'cascade': 'all, delete-orphan'}
+                           'cascade': 'save-update, merge',
+                           'passive_deletes': 'all',
+                           'lazy': 'selectin'}
     well = relationship('InjectionWell', **relationship_config)
-    forecasts = relationship('Forecast', **relationship_config)
+    forecasts = relationship('Forecast', order_by='Forecast.starttime',
+                             **relationship_config)
     seismiccatalog = relationship('SeismicCatalog', **relationship_config)
-    settings = relationship('ProjectSettings')
+    settings = relationship('ProjectSettings', lazy='selectin')
+
+    @classmethod
+    def loader_options(cls):
+        """
+        Query loader options for :py:class:`Project` instances. Project
+        relationships (including the well's sections) are loaded eagerly
+        while accessing any other relationship raises instead of silently
+        emitting a lazy load. This is particularly useful to detect *N+1*
+        query patterns during development and testing.
+
+        The usage of :py:meth:`loader_options` is illustrated bellow:
+
+        .. code::
+
+            project = session.query(Project).options(
+                *Project.loader_options()).get(project_id)
+
+        :returns: List of loader options
+        :rtype: list
+        """
+        sections = selectinload(cls.well).selectinload(InjectionWell.sections)
+        return [sections.joinedload(WellSection.hydraulics),
+                sections.joinedload(WellSection.injectionplan),
+                selectinload(cls.forecasts),
+                selectinload(cls.seismiccatalog),
+                selectinload(cls.settings),
+                raiseload('*')]
 
     # TODO(damb):
     # * Implement a project factory/builder instead of using/abusing the
@@ -3,10 +3,14 @@
 Seismicity prediction related ORM facilities.
 """
 
+import collections
+
 from geoalchemy2 import Geometry
 
-from sqlalchemy import Column, String, Integer, ForeignKey
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import Column, String, Integer, ForeignKey, Index, inspect
+from sqlalchemy.orm import (relationship, backref, aliased, joinedload,
+                            lazyload, raiseload, selectinload)
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ramsis.datamodel.base import ORMBase, RealQuantityMixin
 from ramsis.datamodel.model import Model, ModelRun, EModel
@@ -59,8 +63,11 @@ class SeismicityModelRun(ModelRun):
 
     # relation: SeismicityModel
     model_id = Column(Integer, ForeignKey('seismicitymodel.id'))
+    # XXX(damb): A model run without its model is meaningless; the
+    # many-to-one is loaded by means of a JOIN.
     model = relationship('SeismicityModel',
-                         back_populates='runs')
+                         back_populates='runs',
+                         lazy='joined')
     # relation: SeismicityForecastStage
     forecaststage_id = Column(Integer,
                               ForeignKey('seismicityforecaststage.id'))
@@ -70,12 +77,37 @@ class SeismicityModelRun(ModelRun):
     result = relationship('ReservoirSeismicityPrediction',
                           back_populates='modelrun',
                           uselist=False,
-                          cascade='all, delete-orphan')
+                          cascade='all, delete-orphan',
+                          lazy='selectin')
+
+    __table_args__ = (
+        Index('ix_seismicitymodelrun_forecaststage_id_model_id',
+              'forecaststage_id', 'model_id'), )
 
     __mapper_args__ = {
         'polymorphic_identity': EModel.SEISMICITY,
     }
 
+    @classmethod
+    def loader_options(cls):
+        """
+        Query loader options for :py:class:`SeismicityModelRun` instances.
+        Both the run's model and its result are loaded eagerly while
+        accessing any other relationship raises instead of silently emitting
+        a lazy load.
+
+        .. code::
+
+            runs = session.query(SeismicityModelRun).options(
+                *SeismicityModelRun.loader_options()).all()
+
+        :returns: List of loader options
+        :rtype: list
+        """
+        return [joinedload(cls.model),
+                selectinload(cls.result),
+                raiseload('*')]
+
     def __repr__(self):
         return '<%s(name=%s, url=%s)>' % (type(self).__name__, self.model.name,
                                           self.model.url)
@@ -102,7 +134,8 @@ class ReservoirSeismicityPrediction(RealQuantityMixin('rate'),
     id = Column(Integer, primary_key=True)
     geom = Column(Geometry(geometry_type='GEOMETRYZ',
                            dimension=3,
-                           management=True),
+                           management=True,
+                           spatial_index=True),
                   nullable=False)
 
     # relation: SeismicityModelRun
@@ -112,12 +145,97 @@ class ReservoirSeismicityPrediction(RealQuantityMixin('rate'),
     # reference: self (Adjacency List Relationships)
     parent_id = Column(Integer,
                        ForeignKey('reservoirseismicityprediction.id'))
+    # XXX(damb): Self-referential eager loading stops after join_depth
+    # levels; deeper levels are loaded lazily, i.e. node by node. Use
+    # load_subtree() to fetch trees of arbitrary depth by means of a single
+    # query.
     children = relationship(
         'ReservoirSeismicityPrediction',
         backref=backref('parent', remote_side=[id]),
-        cascade="all, delete-orphan")
+        cascade="all, delete-orphan",
+        lazy='selectin',
+        join_depth=5)
+
+    @classmethod
+    def load_subtree(cls, session, root_id):
+        """
+        Load a :py:class:`ReservoirSeismicityPrediction` including all its
+        descendants by means of a single recursive query.
+
+        The :code:`children` collections of the nodes returned are populated,
+        i.e. traversing the subtree does not emit any further queries.
+
+        :param session: Session used for querying
+        :type session: :py:class:`sqlalchemy.orm.session.Session`
+        :param int root_id: Identifier of the subtree's root node
+
+        :returns: Root node of the subtree or :code:`None` if there is no
+            node with identifier :code:`root_id`
+        :rtype: :py:class:`ReservoirSeismicityPrediction` or None
+        """
+        subtree = session.query(cls.id).\
+            filter(cls.id == root_id).\
+            cte(name='subtree', recursive=True)
+        child = aliased(cls)
+        subtree = subtree.union_all(
+            session.query(child.id).filter(child.parent_id == subtree.c.id))
+
+        nodes = session.query(cls).\
+            join(subtree, cls.id == subtree.c.id).\
+            options(lazyload(cls.children)).\
+            all()
+
+        children = collections.defaultdict(list)
+        for node in nodes:
+            children[node.parent_id].append(node)
+
+        root = None
+        for node in nodes:
+            set_committed_value(node, 'children', children[node.id])
+            if node.id == root_id:
+                root = node
+
+        return root
+
+    def walk(self):
+        """
+        Traverse the prediction tree rooted at this node in depth-first
+        pre-order, i.e. including the node itself.
+
+        For persistent nodes whose subtree is not loaded completely, the
+        subtree is fetched by means of :py:meth:`load_subtree` in advance,
+        i.e. the traversal does not depend on the relationship's
+        :code:`join_depth`.
+
+        :returns: Generator yielding the nodes of the tree
+        """
+        state = inspect(self)
+        if state.persistent and not self._subtree_loaded():
+            # XXX(damb): load_subtree() overwrites the children collections
+            # with the database state; flush pending changes explicitly since
+            # autoflush might be disabled.
+            state.session.flush()
+            type(self).load_subtree(state.session, self.id)
+
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def _subtree_loaded(self):
+        """
+        Check if the :code:`children` collections of all nodes of the subtree
+        are loaded (without emitting any query).
+        """
+        stack = [self]
+        while stack:
+            children = inspect(stack.pop()).dict.get('children')
+            if children is None:
+                return False
+            stack.extend(children)
+
+        return True
 
     def __iter__(self):
-        # TODO(damb): Implement recursively
-        for c in self.children:
-            yield c
+        return iter(self.children)
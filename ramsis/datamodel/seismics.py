@@ -2,14 +2,39 @@
 """
 Seismics related ORM facilities.
 """
+import bisect
 import functools
+import hashlib
 
-from sqlalchemy import Column
-from sqlalchemy import Integer, ForeignKey, LargeBinary
-from sqlalchemy.orm import relationship, class_mapper
+from sqlalchemy import Column, Index, func, inspect, insert, literal, select
+from sqlalchemy import BigInteger, Integer, ForeignKey
+from sqlalchemy.orm import (relationship, deferred, object_session,
+                            raiseload, selectinload, undefer, validates)
+from sqlalchemy.sql.expression import ClauseElement
 
 from ramsis.datamodel.base import (ORMBase, CreationInfoMixin,
-                                   RealQuantityMixin, TimeQuantityMixin)
+                                   ComparableByValueMixin, RealQuantityMixin,
+                                   TimeQuantityMixin, comparable_attrs,
+                                   copyable_attrs)
+from ramsis.datamodel.type import CompressedBinary
+
+
+def digest(data):
+    """
+    Compute a 64 bit digest of binary data.
+
+    :param data: Data to be digested
+    :type data: bytes or None
+
+    :returns: Signed 64 bit integer digest fitting into a
+        :py:class:`sqlalchemy.types.BigInteger` column or :code:`None` if
+        `data` is :code:`None`
+    :rtype: int or None
+    """
+    if data is None:
+        return None
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(),
+                          'big', signed=True)
 
 
 class SeismicCatalog(CreationInfoMixin, ORMBase):
@@ -17,17 +42,41 @@ class SeismicCatalog(CreationInfoMixin, ORMBase):
     ORM representation of a seismic catalog.
     """
     # relation: Project
-    project_id = Column(Integer, ForeignKey('project.id'))
+    project_id = Column(Integer, ForeignKey('project.id',
+                                            ondelete='CASCADE'))
     project = relationship('Project', back_populates='seismiccatalog')
     # relation: Forecast
-    forecast_id = Column(Integer, ForeignKey('forecast.id'))
+    forecast_id = Column(Integer, ForeignKey('forecast.id',
+                                             ondelete='CASCADE'))
     forecast = relationship('Forecast',
                             back_populates='seismiccatalog')
     # relation: SeismicEvent
     events = relationship('SeismicEvent',
                           back_populates='seismiccatalog',
                           cascade='all, delete-orphan',
-                          order_by='SeismicEvent.datetime_value')
+                          order_by='SeismicEvent.datetime_value',
+                          lazy='selectin')
+
+    @classmethod
+    def loader_options(cls, with_events=True):
+        """
+        Query loader options for :py:class:`SeismicCatalog` instances.
+        Accessing relationships not loaded explicitly raises instead of
+        silently emitting a lazy load.
+
+        .. code::
+
+            catalogs = session.query(SeismicCatalog).options(
+                *SeismicCatalog.loader_options()).all()
+
+        :param bool with_events: Load the catalog's events eagerly
+
+        :returns: List of loader options
+        :rtype: list
+        """
+        options = [selectinload(cls.events)] if with_events else []
+        options.append(raiseload('*'))
+        return options
 
     def snapshot(self, filter_cond=None):
         """
@@ -41,7 +90,10 @@ class SeismicCatalog(CreationInfoMixin, ORMBase):
         :rtype: :py:class:`SeismicCatalog`
         """
         snap = type(self)()
-        snap.events = filter(filter_cond, self.events)
+        if filter_cond is None:
+            snap.events = list(self.events)
+        else:
+            snap.events = [e for e in self.events if filter_cond(e)]
 
         return snap
 
@@ -51,23 +103,135 @@ class SeismicCatalog(CreationInfoMixin, ORMBase):
 
         :param filter_cond: Callable applied on catalog events when removing
             events. Events matching the condition are removed. If `filter_cond`
-            is `None` all events are removed.
-        :type filter_cond: callable or None
+            is `None` all events are removed. For persistent catalogs the
+            condition may be passed as SQL expression, instead (e.g.
+            :code:`SeismicEvent.datetime_value < starttime`).
+        :type filter_cond: callable, SQL expression or None
+
+        :raises ValueError: If `filter_cond` is an SQL expression while the
+            catalog is not persistent
+
+        .. note::
+
+            Removing events from a persistent catalog either entirely or by
+            means of an SQL expression is performed by means of a single bulk
+            :code:`DELETE` statement instead of deleting orphaned events one
+            by one when flushing.
         """
-        try:
-            self.events = filter(lambda e: not filter_cond(e), self.events)
-        except TypeError:
-            if filter_cond is None:
+        is_expr = isinstance(filter_cond, ClauseElement)
+        if filter_cond is None or is_expr:
+            if inspect(self).persistent:
+                self._delete_events(object_session(self), filter_cond)
+            elif is_expr:
+                raise ValueError(
+                    'SQL expressions require a persistent catalog.')
+            else:
                 self.events = []
+            return
+
+        self.events = [e for e in self.events if not filter_cond(e)]
+
+    def _delete_events(self, session, criterion=None):
+        # XXX(damb): Bulk deletes bypass the unit of work; flush pending
+        # changes explicitly since autoflush might be disabled.
+        session.flush()
+        query = session.query(SeismicEvent).\
+            filter(SeismicEvent.seismiccatalog_id == self.id)
+        if criterion is None:
+            query.delete(synchronize_session='evaluate')
+        else:
+            query.filter(criterion).delete(synchronize_session='fetch')
+        session.expire(self, ['events'])
+
+    def load_quakeml(self, session):
+        """
+        Load the deferred :code:`quakeml` attribute of all catalog events by
+        means of a single query.
+
+        :param session: Session the catalog is attached to
+        :type session: :py:class:`sqlalchemy.orm.session.Session`
+        """
+        session.query(SeismicEvent).\
+            options(undefer(SeismicEvent.quakeml)).\
+            filter(SeismicEvent.seismiccatalog_id == self.id).\
+            all()
+
+    def duplicate(self, session, criterion=None):
+        """
+        Duplicate a persistent catalog including its events. Events are
+        copied by the DB by means of a single :code:`INSERT ... SELECT`
+        statement, i.e. without loading them.
+
+        :param session: Session the catalog is attached to
+        :type session: :py:class:`sqlalchemy.orm.session.Session`
+        :param criterion: SQL expression events are filtered with (e.g.
+            :code:`SeismicEvent.datetime_value < starttime`). If `None` all
+            events are copied.
+
+        :returns: Duplicated catalog
+        :rtype: :py:class:`SeismicCatalog`
+        """
+        new = type(self)()
+        for attr in copyable_attrs(type(self)):
+            setattr(new, attr, getattr(self, attr))
+
+        session.add(new)
+        session.flush()
+
+        table = SeismicEvent.__table__
+        cols = [c for c in table.c
+                if not c.primary_key and c is not table.c.seismiccatalog_id]
+        query = select(cols + [literal(new.id)]).\
+            where(table.c.seismiccatalog_id == self.id)
+        if criterion is not None:
+            query = query.where(criterion)
+
+        stmt = insert(table).from_select(
+            [c.name for c in cols] + [table.c.seismiccatalog_id.name], query)
+        session.execute(stmt)
+        session.expire(new, ['events'])
+
+        return new
+
+    def events_between(self, starttime, endtime):
+        """
+        Return the catalog's events within a time interval. Events are looked
+        up by means of binary search.
+
+        :param starttime: Start of the interval (inclusive)
+        :type starttime: :py:class:`datetime.datetime`
+        :param endtime: End of the interval (inclusive)
+        :type endtime: :py:class:`datetime.datetime`
+
+        :returns: Events within the interval
+        :rtype: list
+
+        .. note::
+
+            The catalog's events are required to be ordered by
+            :code:`datetime_value` (which is the case for events loaded from
+            the DB).
+        """
+        keys = _EventTimes(self.events)
+        lo = bisect.bisect_left(keys, starttime)
+        hi = bisect.bisect_right(keys, endtime, lo)
+        return self.events[lo:hi]
 
     def __getitem__(self, item):
         return self.events[item] if self.events else None
 
     def __iter__(self):
-        for e in self.events:
-            yield e
+        return iter(self.events)
 
     def __len__(self):
+        # XXX(damb): Count the events of a persistent catalog by means of the
+        # DB if they are not loaded, yet.
+        state = inspect(self)
+        if state.persistent and 'events' in state.unloaded:
+            return state.session.query(func.count(SeismicEvent.id)).\
+                filter(SeismicEvent.seismiccatalog_id == self.id).\
+                scalar()
+
         return len(self.events)
 
     def __repr__(self):
@@ -76,7 +240,8 @@ class SeismicCatalog(CreationInfoMixin, ORMBase):
 
 
 @functools.total_ordering
-class SeismicEvent(TimeQuantityMixin('datetime'),
+class SeismicEvent(ComparableByValueMixin,
+                   TimeQuantityMixin('datetime'),
                    RealQuantityMixin('x'),
                    RealQuantityMixin('y'),
                    RealQuantityMixin('z'),
@@ -93,13 +258,28 @@ class SeismicEvent(TimeQuantityMixin('datetime'),
     the XML, if necessary converted, and kept alongside using a flat
     representation.
     """
-    quakeml = Column(LargeBinary, nullable=False)
+    # XXX(damb): The original QuakeML representation is rarely required;
+    # load it explicitly by means of SeismicCatalog.load_quakeml().
+    quakeml = deferred(Column(CompressedBinary, nullable=False))
+    # XXX(damb): Digest of quakeml maintained when assigning quakeml. Allows
+    # hashing events without loading the deferred XML.
+    quakeml_digest = Column(BigInteger, index=True)
 
     # relation: SeismicCatalog
-    seismiccatalog_id = Column(Integer, ForeignKey('seismiccatalog.id'))
+    seismiccatalog_id = Column(Integer, ForeignKey('seismiccatalog.id',
+                                                   ondelete='CASCADE'))
     seismiccatalog = relationship('SeismicCatalog',
                                   back_populates='events')
 
+    __table_args__ = (
+        Index('ix_seismicevent_seismiccatalog_id_datetime_value',
+              'seismiccatalog_id', 'datetime_value'), )
+
+    @validates('quakeml')
+    def _update_quakeml_digest(self, key, value):
+        self.quakeml_digest = digest(value)
+        return value
+
     def copy(self, with_foreignkeys=False):
         """
         Copy a seismic event omitting primary keys.
@@ -109,24 +289,18 @@ class SeismicEvent(TimeQuantityMixin('datetime'),
         :returns: Copy of seismic event
         :rtype: :py:class:`SeismicEvent`
         """
-        mapper = class_mapper(type(self))
-        new = type(self)()
-
-        pk_keys = set([c.key for c in mapper.primary_key])
-        rel_keys = set([c.key for c in mapper.relationships])
-        omit = pk_keys | rel_keys
+        state = inspect(self)
+        # XXX(damb): Avoid loading the deferred QuakeML event by event when
+        # copying the events of a persistent catalog; load the blobs of all
+        # events of the catalog at once.
+        if ('quakeml' in state.unloaded and state.persistent and
+                self.seismiccatalog is not None):
+            self.seismiccatalog.load_quakeml(state.session)
 
-        if with_foreignkeys:
-            fk_keys = set([c.key for c in mapper.columns if c.foreign_keys])
-            omit = omit | fk_keys
+        new = type(self)()
 
-        for attr in [p.key for p in mapper.iterate_properties
-                     if p.key not in omit]:
-            try:
-                value = getattr(self, attr)
-                setattr(new, attr, value)
-            except AttributeError:
-                pass
+        for attr in copyable_attrs(type(self), with_foreignkeys):
+            setattr(new, attr, getattr(self, attr))
 
         return new
 
@@ -138,27 +312,46 @@ class SeismicEvent(TimeQuantityMixin('datetime'),
         raise ValueError
 
     def __eq__(self, other):
-        if isinstance(other, SeismicEvent):
-            mapper = class_mapper(type(self))
+        if not isinstance(other, SeismicEvent):
+            return NotImplemented
+
+        # XXX(damb): Unequal events usually differ in time or magnitude;
+        # compare those first. Differing digests imply differing QuakeML
+        # without loading the deferred XML; equal digests stand in for equal
+        # QuakeML.
+        if (self.datetime_value != other.datetime_value or
+                self.magnitude_value != other.magnitude_value):
+            return False
+        if (self.quakeml_digest is None or other.quakeml_digest is None):
+            return super().__eq__(other)
+
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in comparable_attrs(type(self))
+                   if attr != 'quakeml')
 
-            pk_keys = set([c.key for c in mapper.primary_key])
-            rel_keys = set([c.key for c in mapper.relationships])
-            fk_keys = set([c.key for c in mapper.columns if c.foreign_keys])
+    def __hash__(self):
+        h = self.quakeml_digest
+        if h is None:
+            h = digest(self.quakeml)
+        # XXX(damb): Events without QuakeML must be hashable, too.
+        return 0 if h is None else h
 
-            omit = pk_keys | rel_keys | fk_keys
+    def __repr__(self):
+        return "<{}(datetime={!r}, magnitude={!r})>".format(
+            type(self).__name__, self.datetime_value, self.magnitude_value)
 
-            return all(getattr(self, attr) == getattr(other, attr)
-                       for attr in [p.key for p in mapper.iterate_properties
-                                    if p.key not in omit])
 
-        raise ValueError
+class _EventTimes(object):
+    """
+    Read-only sequence view of the :code:`datetime_value` attributes of
+    ordered events.
+    """
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
+    def __init__(self, events):
+        self._events = events
 
-    def __hash__(self):
-        return hash(self.quakeml)
+    def __getitem__(self, idx):
+        return self._events[idx].datetime_value
 
-    def __repr__(self):
-        return "<{}(datetime={!r}, magnitude={!r})>".format(
-            type(self).__name__, self.datetime_value, self.magnitude_value)
+    def __len__(self):
+        return len(self._events)
@@ -10,18 +10,22 @@ import abc
 import collections
 import datetime
 import json
+import re
 
 from sqlalchemy import Column, String, DateTime, ForeignKey
 from sqlalchemy.ext.declarative.api import DeclarativeMeta
 from sqlalchemy.orm import reconstructor, relationship
 
 from ramsis.datamodel.base import ORMBase, NameMixin
+from ramsis.datamodel.signal import Signal
 
 
 # TODO(damb): Better make use of a ISO8601 conform date format. With
 # https://docs.obspy.org/packages/autogen/obspy.core.utcdatetime.UTCDateTime.html
 # e.g. obspy implements already the according infrastructure.
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+# XXX(damb): Matches strings formatted according to DATE_FORMAT
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\Z')
 
 
 def datetime_encoder(x):
@@ -32,9 +36,11 @@ def datetime_encoder(x):
 
 def datetime_decoder(dct):
     for k, v in dct.items():
-        if isinstance(v, str):
+        if isinstance(v, str) and DATE_RE.match(v):
             try:
-                dct[k] = datetime.datetime.strptime(v, DATE_FORMAT)
+                dct[k] = datetime.datetime(
+                    int(v[0:4]), int(v[5:7]), int(v[8:10]),
+                    int(v[11:13]), int(v[14:16]), int(v[17:19]))
             except ValueError:
                 pass
     return dct
@@ -71,10 +77,21 @@ class Settings(collections.UserDict, NameMixin, ORMBase,
         'polymorphic_identity': 'settings'
     }
 
+    @property
+    def settings_changed(self):
+        """
+        Signal emitted by :py:meth:`commit`. The signal is created on first
+        access, only.
+        """
+        signal = self.__dict__.get('_settings_changed')
+        if signal is None:
+            signal = self.__dict__['_settings_changed'] = Signal()
+        return signal
+
     @reconstructor
     def init_on_load(self):
         self.data = (json.loads(self.config,
-                                object_hook=datetime.datetime_decoder)
+                                object_hook=datetime_decoder)
                      if self.config else {})
 
     def commit(self):
@@ -84,18 +101,32 @@ class Settings(collections.UserDict, NameMixin, ORMBase,
         This updates the internal json string and the date property if we keep
         a history of this Settings object. You still need to commit the object
         to the database afterwards.
-        Emits the settings_changed signal
+        Emits the settings_changed signal if the settings actually changed.
 
         """
-        self.config = json.dumps(self.data, indent=4, default=datetime_encoder)
+        config = self._serialize()
+        if config == self.config:
+            return
+
+        self.config = config
         self.settings_changed.emit(self)
 
+    def _serialize(self):
+        # XXX(damb): Pretty-printing (i.e. indent) disables the json module's
+        # C accelerated encoder.
+        return json.dumps(self.data, default=datetime_encoder)
+
 
 class ProjectSettings(Settings):
     __tablename__ = 'settings'
 
+    # XXX(damb): Typed copy of the 'forecast_start' setting. The column is
+    # kept in sync with the JSON encoded configuration when committing and
+    # allows querying settings without decoding the configuration.
+    forecast_start = Column(DateTime, index=True)
+
     # relation: Project
-    project_id = Column(ForeignKey('project.id'))
+    project_id = Column(ForeignKey('project.id', ondelete='SET NULL'))
     project = relationship('Project', back_populates='settings')
 
     __mapper_args__ = {'polymorphic_identity': 'project'}
@@ -122,4 +153,11 @@ class ProjectSettings(Settings):
 
         for key, default_value in self.DEFAULTS.items():
             self.setdefault(key, default=default_value)
-        self.commit()
+        # XXX(damb): Nobody is able to observe a settings object under
+        # construction; serialize the defaults without emitting a signal.
+        self.config = self._serialize()
+        self.forecast_start = self['forecast_start']
+
+    def commit(self):
+        self.forecast_start = self.get('forecast_start')
+        super().commit()
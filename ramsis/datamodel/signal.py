@@ -0,0 +1,30 @@
+# Copyright 2019, ETH Zurich - Swiss Seismological Service SED
+"""
+Lightweight signal facilities.
+"""
+
+
+class Signal(object):
+    """
+    Pure Python signal implementation. Slots (i.e. callables) connected to a
+    :py:class:`Signal` are called with the arguments passed to
+    :py:meth:`emit` in the order they were connected.
+    """
+    __slots__ = ('_connections', )
+
+    def __init__(self):
+        self._connections = []
+
+    def connect(self, slot):
+        if slot not in self._connections:
+            self._connections.append(slot)
+
+    def disconnect(self, slot):
+        try:
+            self._connections.remove(slot)
+        except ValueError:
+            pass
+
+    def emit(self, *args, **kwargs):
+        for slot in self._connections:
+            slot(*args, **kwargs)
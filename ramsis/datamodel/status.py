@@ -5,14 +5,13 @@ Processing status related ORM facilities.
 
 import datetime
 import enum
-import json
 
-from sqlalchemy import Column, Integer, Enum, PickleType, ForeignKey
+from sqlalchemy import Column, Integer, Enum, ForeignKey
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from ramsis.datamodel.base import ORMBase, UniqueEpochMixin
-from ramsis.datamodel.type import GUID
+from ramsis.datamodel.type import GUID, JSONEncodedDict
 
 
 class EStatus(enum.Enum):
@@ -22,6 +21,9 @@ class EStatus(enum.Enum):
     COMPLETE = 3
 
 
+_FINISHED = frozenset((EStatus.ERROR, EStatus.COMPLETE))
+
+
 class Status(UniqueEpochMixin, ORMBase):
     """
     General purpose calculation status ORM representation for bookkeeping
@@ -37,7 +39,7 @@ class Status(UniqueEpochMixin, ORMBase):
     # TODO(damb): Check if UUID is better located at ModelRun
     uuid = Column(GUID, unique=True, index=True, nullable=False)
     state = Column(Enum(EStatus), default=EStatus.PENDING)
-    info = Column(PickleType(pickler=json))
+    info = Column(JSONEncodedDict)
 
     # relation: ModelRun
     run_id = Column(Integer, ForeignKey('modelrun.id'))
@@ -51,4 +53,8 @@ class Status(UniqueEpochMixin, ORMBase):
 
     @hybrid_property
     def finished(self):
-        return self.state in (EStatus.ERROR, EStatus.COMPLETE)
+        return self.state in _FINISHED
+
+    @finished.expression
+    def finished(cls):
+        return cls.state.in_(_FINISHED)
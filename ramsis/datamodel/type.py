@@ -5,9 +5,10 @@
 
 import json
 import uuid
+import zlib
 
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.types import TypeDecorator, CHAR, VARCHAR
+from sqlalchemy.types import TypeDecorator, CHAR, LargeBinary, VARCHAR
 
 
 class JSONEncodedDict(TypeDecorator):
@@ -28,26 +29,62 @@ class JSONEncodedDict(TypeDecorator):
         return value
 
 
+class CompressedBinary(TypeDecorator):
+    """
+    Binary data stored `zlib <https://zlib.net/>`_ compressed. Values are
+    transparently compressed when bound and decompressed when loaded.
+
+    .. note::
+
+        Values not compressed (e.g. rows written before the column was
+        migrated) are returned unmodified. Values are considered to be
+        compressed if they start with a zlib header; corrupt compressed
+        values raise :py:class:`zlib.error`.
+    """
+    impl = LargeBinary
+
+    def __init__(self, *args, level=6, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.level = level
+
+    def process_bind_param(self, value, dialect):
+        if value is not None:
+            value = zlib.compress(value, self.level)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None:
+            value = bytes(value)
+            # XXX(damb): zlib streams start with 0x78 (deflate, 32K window)
+            # while legacy values are uncompressed XML.
+            if value[:1] == b'x':
+                value = zlib.decompress(value)
+        return value
+
+
 class GUID(TypeDecorator):
     """
     Platform-independent GUID type.
 
     Uses PostgreSQL's UUID type, otherwise uses
     CHAR(32), storing as stringified hex values.
+
+    .. note::
+
+        On PostgreSQL values are converted by the driver's native
+        :code:`uuid` support, i.e. no additional conversion is performed.
     """
     impl = CHAR
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
-            return dialect.type_descriptor(UUID())
+            return dialect.type_descriptor(UUID(as_uuid=True))
         else:
             return dialect.type_descriptor(CHAR(32))
 
     def process_bind_param(self, value, dialect):
-        if value is None:
+        if value is None or dialect.name == 'postgresql':
             return value
-        elif dialect.name == 'postgresql':
-            return str(value)
         else:
             if not isinstance(value, uuid.UUID):
                 return "%.32x" % uuid.UUID(value).int
@@ -3,14 +3,21 @@
 Injection well ORM facilities.
 """
 
-from sqlalchemy import Column, Integer, Boolean, String, ForeignKey
+from operator import attrgetter
+
+from sqlalchemy import (Column, Integer, Boolean, String, ForeignKey, Index,
+                        func, select)
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, raiseload, selectinload
 
 from ramsis.datamodel.base import (ORMBase, CreationInfoMixin, PublicIDMixin,
                                    UniqueOpenEpochMixin, RealQuantityMixin)
 
 
+_TOPDEPTH = attrgetter('topdepth_value')
+_BOTTOMDEPTH = attrgetter('bottomdepth_value')
+
+
 class InjectionWell(PublicIDMixin,
                     CreationInfoMixin,
                     RealQuantityMixin('bedrockdepth', optional=True),
@@ -24,36 +31,52 @@ class InjectionWell(PublicIDMixin,
         <https://quake.ethz.ch/quakeml>`_ real quantities.
     """
     # relation: Project
-    project_id = Column(Integer, ForeignKey('project.id'))
+    project_id = Column(Integer, ForeignKey('project.id',
+                                            ondelete='CASCADE'))
     project = relationship('Project', back_populates='well')
     # relation: Forecast
-    forecast_id = Column(Integer, ForeignKey('forecast.id'))
+    forecast_id = Column(Integer, ForeignKey('forecast.id',
+                                             ondelete='SET NULL'))
     forecast = relationship('Forecast', back_populates='well')
     # relation: ForecastScenario
-    scenario_id = Column(Integer, ForeignKey('forecastscenario.id'))
+    scenario_id = Column(Integer, ForeignKey('forecastscenario.id',
+                                             ondelete='SET NULL'))
     scenario = relationship('ForecastScenario', back_populates='well')
 
     # relation: WellSection
     sections = relationship('WellSection',
                             back_populates='well',
-                            cascade='all, delete-orphan')
+                            cascade='all, delete-orphan',
+                            lazy='selectin')
 
     @hybrid_property
     def longitude(self):
-        # min topdepth defines top-section
-        return min([s for s in self.sections],
-                   key=lambda x: x.topdepth_value).toplongitude_value
+        top = self._top_section()
+        return top.toplongitude_value if top is not None else None
+
+    @longitude.expression
+    def longitude(cls):
+        return cls._top_section_expr(WellSection.toplongitude_value)
 
     @hybrid_property
     def latitude(self):
-        # min topdepth defines top-section
-        return min([s for s in self.sections],
-                   key=lambda x: x.topdepth_value).toplatitude_value
+        top = self._top_section()
+        return top.toplatitude_value if top is not None else None
+
+    @latitude.expression
+    def latitude(cls):
+        return cls._top_section_expr(WellSection.toplatitude_value)
 
     @hybrid_property
     def depth(self):
         # max bottomdepth defines bottom-section
-        return max([s.bottomdepth_value for s in self.sections])
+        return max(map(_BOTTOMDEPTH, self.sections), default=None)
+
+    @depth.expression
+    def depth(cls):
+        return select([func.max(WellSection.bottomdepth_value)]).\
+            where(WellSection.well_id == cls.id).\
+            as_scalar()
 
     @hybrid_property
     def injectionpoint(self):
@@ -65,9 +88,9 @@ class InjectionWell(PublicIDMixin,
 
             The implementation requires boreholes to be linear.
         """
-        isection = min([s for s in self.sections
-                       if s.casingdiameter_value and not s.bottomclosed],
-                       key=lambda x: x.bottomdepth_value, default=None)
+        isection = min((s for s in self.sections
+                        if s.casingdiameter_value and not s.bottomclosed),
+                       key=_BOTTOMDEPTH, default=None)
 
         if not isection:
             raise ValueError('Cased borehole has a closed bottom.')
@@ -76,14 +99,69 @@ class InjectionWell(PublicIDMixin,
                 isection.bottomlatitude_value,
                 isection.bottomdepth_value)
 
-    def __iter__(self):
+    @classmethod
+    def loader_options(cls):
+        """
+        Query loader options for :py:class:`InjectionWell` instances. Well
+        sections including their hydraulics and injection plans are loaded
+        eagerly while accessing any other relationship (including the
+        hydraulic samples) raises instead of silently emitting a lazy load.
+
+        .. code::
+
+            wells = session.query(InjectionWell).options(
+                *InjectionWell.loader_options()).all()
+
+        :returns: List of loader options
+        :rtype: list
+        """
+        sections = selectinload(cls.sections)
+        return [sections.joinedload(WellSection.hydraulics),
+                sections.joinedload(WellSection.injectionplan),
+                raiseload('*')]
+
+    @classmethod
+    def _top_section_expr(cls, column):
+        # correlated subquery selecting column from the top-section
+        return select([column]).\
+            where(WellSection.well_id == cls.id).\
+            order_by(WellSection.topdepth_value).\
+            limit(1).\
+            as_scalar()
+
+    def _top_section(self):
+        # min topdepth defines top-section
+        return min(self.sections, key=_TOPDEPTH, default=None)
+
+    def _extrema(self):
+        """
+        Determine both the top section and the well's depth by means of a
+        single pass over the well's sections.
+
+        :returns: Tuple of top section and depth. If the well does not ship
+            any sections :code:`(None, None)` is returned.
+        :rtype: tuple
+        """
+        top = None
+        depth = None
         for s in self.sections:
-            yield s
+            if top is None or s.topdepth_value < top.topdepth_value:
+                top = s
+            if depth is None or s.bottomdepth_value > depth:
+                depth = s.bottomdepth_value
+
+        return top, depth
+
+    def __iter__(self):
+        return iter(self.sections)
 
     def __repr__(self):
+        top, depth = self._extrema()
+        longitude, latitude = ((top.toplongitude_value, top.toplatitude_value)
+                               if top is not None else (None, None))
         return ("<{}(publicid={!r}, longitude={}, latitude={}, "
                 "depth={})>").format(type(self).__name__, self.publicid,
-                                     self.longitude, self.latitude, self.depth)
+                                     longitude, latitude, depth)
 
 
 class WellSection(PublicIDMixin,
@@ -108,16 +186,27 @@ class WellSection(PublicIDMixin,
     description = Column(String)
 
     # relation: InjectionWell
-    well_id = Column(Integer, ForeignKey('injectionwell.id'))
+    well_id = Column(Integer, ForeignKey('injectionwell.id',
+                                         ondelete='CASCADE'))
     well = relationship('InjectionWell', back_populates='sections')
 
+    # XXX(damb): One-to-one relationships are loaded by means of a JOIN;
+    # there is no row multiplication.
     # relation: Hydraulics
     hydraulics = relationship('Hydraulics',
                               back_populates='wellsection',
                               uselist=False,
-                              cascade='all, delete-orphan')
+                              cascade='all, delete-orphan',
+                              lazy='joined')
     # relation: InjectionPlan
     injectionplan = relationship('InjectionPlan',
                                  back_populates='wellsection',
                                  uselist=False,
-                                 cascade='all, delete-orphan')
+                                 cascade='all, delete-orphan',
+                                 lazy='joined')
+
+    __table_args__ = (
+        Index('ix_wellsection_well_id_topdepth_value',
+              'well_id', 'topdepth_value'),
+        Index('ix_wellsection_well_id_bottomdepth_value',
+              'well_id', 'bottomdepth_value'), )
@@ -3,12 +3,14 @@
 General purpose DB test facilities.
 """
 
+import contextlib
 import os
 import unittest
-import tempfile
 
 from sqlalchemy import create_engine
-from sqlalchemy.event import listen
+from sqlalchemy.event import listen, remove
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.sql import select, func
 
 from ramsis.datamodel.status import Status # noqa
@@ -28,6 +30,12 @@ def load_spatialite(dbapi_conn, connection_record):
     # XXX(damb): sudo apt-get install libsqlite3-mod-spatialite
     dbapi_conn.enable_load_extension(True)
     dbapi_conn.load_extension('/usr/lib/x86_64-linux-gnu/mod_spatialite.so')
+    # XXX(damb): Durability is irrelevant for test DBs.
+    dbapi_conn.execute('PRAGMA journal_mode=MEMORY')
+    dbapi_conn.execute('PRAGMA synchronous=OFF')
+    dbapi_conn.execute('PRAGMA temp_store=MEMORY')
+    # XXX(damb): Deleting projects relies on ON DELETE CASCADE.
+    dbapi_conn.execute('PRAGMA foreign_keys=ON')
 
 # load_spatialite ()
 
@@ -39,26 +47,68 @@ def load_spatialite(dbapi_conn, connection_record):
     "'RAMSIS_TEST_GISDB' envvar not 'True'")
 class GISDBTestCase(unittest.TestCase):
 
-    def setUp(self):
-        _, self.path_db = tempfile.mkstemp(dir=tempfile.gettempdir())
+    # XXX(damb): Initializing the spatial metadata is expensive; the DB is
+    # set up once per test case class.
+    @classmethod
+    def setUpClass(cls):
         # XXX(damb): see:
         # https://geoalchemy-2.readthedocs.io/en/latest/spatialite_tutorial.html
-        self.engine = create_engine('sqlite:///{}'.format(self.path_db))
-        listen(self.engine, 'connect', load_spatialite)
-
-        conn = self.engine.connect()
-        conn.execute(select([func.InitSpatialMetaData()]))
+        # A single in-memory connection is shared by means of a StaticPool,
+        # i.e. spatialite is loaded exactly once.
+        cls.engine = create_engine('sqlite://',
+                                   poolclass=StaticPool,
+                                   connect_args={'check_same_thread': False})
+        listen(cls.engine, 'connect', load_spatialite)
+
+        conn = cls.engine.connect()
+        # XXX(damb): Populate spatial_ref_sys within a single transaction
+        conn.execute(select([func.InitSpatialMetaData(1)]))
         conn.close()
 
-    # setUp ()
+        ORMBase.metadata.create_all(cls.engine)
+
+    # setUpClass ()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        self.session = sessionmaker(bind=self.engine)()
 
     def tearDown(self):
-        os.remove(self.path_db)
+        self.session.close()
+        with self.engine.begin() as conn:
+            for table in reversed(ORMBase.metadata.sorted_tables):
+                conn.execute(table.delete())
+
+    @contextlib.contextmanager
+    def statements(self):
+        """
+        Context manager collecting the SQL statements emitted by the engine.
+
+        :returns: List of statements (populated while the context is active)
+        """
+        stmts = []
+
+        def append(conn, cursor, statement, *args):
+            stmts.append(statement)
+
+        listen(self.engine, 'before_cursor_execute', append)
+        try:
+            yield stmts
+        finally:
+            remove(self.engine, 'before_cursor_execute', append)
+
+# class GISDBTestCase
+
+
+class CreateTablesTestCase(GISDBTestCase):
 
     def test_create_tables(self):
         self.assertIsNone(ORMBase.metadata.create_all(self.engine))
 
-# class GISDBTestCase
+# class CreateTablesTestCase
 
 
 # ----- END OF test_db.py -----
@@ -0,0 +1,67 @@
+# Copyright (C) 2019, ETH Zurich - Swiss Seismological Service SED
+"""
+Hydraulics related test facilities.
+"""
+
+import datetime
+import unittest
+
+from ramsis.datamodel.status import Status  # noqa
+from ramsis.datamodel.seismicity import SeismicityModel  # noqa
+from ramsis.datamodel.forecast import Forecast  # noqa
+from ramsis.datamodel.seismics import SeismicCatalog  # noqa
+from ramsis.datamodel.well import InjectionWell  # noqa
+from ramsis.datamodel.hydraulics import (Hydraulics, InjectionPlan,  # noqa
+                                         HydraulicSample)
+from ramsis.datamodel.settings import ProjectSettings  # noqa
+from ramsis.datamodel.project import Project  # noqa
+from tests import test_db
+
+
+class HydraulicSampleTestCase(unittest.TestCase):
+
+    def test_eq(self):
+        dt = datetime.datetime(2019, 1, 1)
+        s0 = HydraulicSample(datetime_value=dt, topflow_value=1.)
+        s1 = HydraulicSample(datetime_value=dt, topflow_value=1.)
+        s2 = HydraulicSample(datetime_value=dt, topflow_value=2.)
+
+        self.assertEqual(s0, s1)
+        self.assertNotEqual(s0, s2)
+
+    def test_hash(self):
+        dt = datetime.datetime(2019, 1, 1)
+        s0 = HydraulicSample(datetime_value=dt, topflow_value=1.)
+        s1 = HydraulicSample(datetime_value=dt, topflow_value=1.)
+        s2 = HydraulicSample(datetime_value=dt, topflow_value=2.)
+
+        self.assertEqual(hash(s0), hash(s1))
+        self.assertEqual(len(set([s0, s1, s2])), 2)
+
+
+class HydraulicSampleDBTestCase(test_db.GISDBTestCase):
+
+    def test_bulk_create(self):
+        dt = datetime.datetime(2019, 1, 1)
+        hydraulics = Hydraulics()
+        self.session.add(hydraulics)
+        samples = [dict(datetime_value=dt + datetime.timedelta(seconds=i),
+                        topflow_value=float(i)) for i in range(10)]
+
+        with self.statements() as stmts:
+            HydraulicSample.bulk_create(self.session, samples,
+                                        hydraulics=hydraulics)
+
+        # XXX(damb): parent and samples (executemany)
+        self.assertEqual(len(stmts), 2)
+        self.assertEqual([s.topflow_value for s in hydraulics.samples],
+                         [float(i) for i in range(10)])
+
+    def test_bulk_create_detached(self):
+        samples = [dict(datetime_value=datetime.datetime(2019, 1, 1))]
+
+        with self.assertRaises(ValueError):
+            HydraulicSample.bulk_create(self.session, samples,
+                                        hydraulics=Hydraulics())
+
+        self.assertEqual(self.session.query(HydraulicSample).count(), 0)
@@ -0,0 +1,79 @@
+# Copyright (C) 2019, ETH Zurich - Swiss Seismological Service SED
+"""
+Project related test facilities.
+"""
+
+import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import InvalidRequestError
+
+from ramsis.datamodel.status import Status  # noqa
+from ramsis.datamodel.seismicity import SeismicityModel  # noqa
+from ramsis.datamodel.forecast import Forecast  # noqa
+from ramsis.datamodel.seismics import SeismicCatalog, SeismicEvent
+from ramsis.datamodel.well import InjectionWell, WellSection
+from ramsis.datamodel.hydraulics import Hydraulics, HydraulicSample
+from ramsis.datamodel.settings import ProjectSettings  # noqa
+from ramsis.datamodel.project import Project
+from ramsis.datamodel.base import ORMBase
+from tests import test_db
+from tests.test_well import TOP_SECTION
+
+
+def create_project():
+    dt = datetime.datetime(2019, 1, 1)
+    section = WellSection(
+        hydraulics=Hydraulics(samples=[HydraulicSample(datetime_value=dt)]),
+        **TOP_SECTION)
+    event = SeismicEvent(datetime_value=dt, x_value=0, y_value=0, z_value=0,
+                         magnitude_value=1, quakeml=b'<event/>')
+
+    return Project(
+        name='project',
+        starttime=dt,
+        referencepoint='SRID=4326;POINT Z(8.925 46.906 0)',
+        spatialreference='+proj=longlat +datum=WGS84 +no_defs',
+        well=[InjectionWell(sections=[section]), InjectionWell()],
+        seismiccatalog=[SeismicCatalog(events=[event]), SeismicCatalog()])
+
+
+class ProjectTestCase(test_db.GISDBTestCase):
+
+    def count_rows(self):
+        return {t.name: self.session.execute(
+            select([func.count()]).select_from(t)).scalar()
+            for t in ORMBase.metadata.sorted_tables}
+
+    def test_delete(self):
+        project = create_project()
+        self.session.add(project)
+        self.session.commit()
+
+        self.session.delete(project)
+        self.session.commit()
+
+        self.assertEqual(set(self.count_rows().values()), {0})
+
+    def test_loader_options(self):
+        self.session.add(create_project())
+        self.session.commit()
+        self.session.expunge_all()
+
+        with self.statements() as stmts:
+            project = self.session.query(Project).\
+                options(*Project.loader_options()).\
+                one()
+            repr(project.well)
+            well = next(w for w in project.well if w.sections)
+            hydraulics = well.sections[0].hydraulics
+
+        # XXX(damb): project, wells, sections (joined with hydraulics and
+        # injection plans), forecasts, catalogs and settings
+        self.assertEqual(len(stmts), 6)
+        self.assertIsNotNone(hydraulics)
+
+        with self.assertRaises(InvalidRequestError):
+            hydraulics.samples
+        with self.assertRaises(InvalidRequestError):
+            project.seismiccatalog[0].events
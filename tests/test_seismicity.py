@@ -0,0 +1,166 @@
+# Copyright (C) 2019, ETH Zurich - Swiss Seismological Service SED
+"""
+Seismicity related test facilities.
+"""
+
+import itertools
+import unittest
+
+from sqlalchemy.exc import InvalidRequestError
+
+from ramsis.datamodel.status import Status  # noqa
+from ramsis.datamodel.seismicity import (SeismicityModel,
+                                         SeismicityModelRun,
+                                         ReservoirSeismicityPrediction)
+from ramsis.datamodel.forecast import Forecast  # noqa
+from ramsis.datamodel.seismics import SeismicCatalog  # noqa
+from ramsis.datamodel.well import InjectionWell  # noqa
+from ramsis.datamodel.hydraulics import Hydraulics, InjectionPlan  # noqa
+from ramsis.datamodel.settings import ProjectSettings  # noqa
+from ramsis.datamodel.project import Project  # noqa
+from tests import test_db
+
+
+# XXX(damb): Deeper than the join_depth of
+# ReservoirSeismicityPrediction.children
+DEPTH = 6
+
+
+def create_tree(depth=DEPTH, fanout=2):
+    """
+    Create a prediction tree. The nodes' :code:`rate_value` attributes
+    enumerate the nodes in depth-first pre-order.
+    """
+    counter = itertools.count()
+
+    def create_node(level):
+        node = ReservoirSeismicityPrediction(geom='POINT Z(0 0 0)',
+                                             rate_value=next(counter),
+                                             bvalue_value=1)
+        if level < depth:
+            node.children = [create_node(level + 1) for _ in range(fanout)]
+        return node
+
+    return create_node(0)
+
+
+def preorder(node):
+    return [node] + [n for c in node.children for n in preorder(c)]
+
+
+class ReservoirSeismicityPredictionTestCase(unittest.TestCase):
+
+    def test_walk(self):
+        root = create_tree(depth=3)
+
+        self.assertEqual([n.rate_value for n in root.walk()],
+                         list(range(15)))
+
+
+class ReservoirSeismicityPredictionDBTestCase(test_db.GISDBTestCase):
+
+    def persist_tree(self, **kwargs):
+        root = create_tree(**kwargs)
+        self.session.add(root)
+        self.session.commit()
+        root_id = root.id
+        self.session.expunge_all()
+
+        return root_id
+
+    def test_walk(self):
+        root_id = self.persist_tree()
+        root = self.session.query(ReservoirSeismicityPrediction).get(root_id)
+
+        with self.statements() as stmts:
+            nodes = list(root.walk())
+
+        self.assertEqual(len(stmts), 1)
+        self.assertEqual(len(nodes), 2 ** (DEPTH + 1) - 1)
+        self.assertEqual(nodes, preorder(root))
+
+        # subtrees already loaded
+        with self.statements() as stmts:
+            list(root.walk())
+            list(root.children[0].walk())
+
+        self.assertEqual(stmts, [])
+
+    def test_walk_no_autoflush(self):
+        root_id = self.persist_tree()
+        root = self.session.query(ReservoirSeismicityPrediction).get(root_id)
+
+        with self.session.no_autoflush:
+            leaf = root
+            while leaf.children:
+                leaf = leaf.children[0]
+            new = ReservoirSeismicityPrediction(geom='POINT Z(0 0 0)',
+                                                rate_value=-1, bvalue_value=1)
+            leaf.children.append(new)
+
+            with self.statements() as stmts:
+                nodes = list(root.walk())
+
+        self.assertIn(new, nodes)
+        self.assertEqual(len(nodes), 2 ** (DEPTH + 1))
+        # pending changes are flushed before loading the subtree
+        self.assertEqual(
+            len([s for s in stmts if not s.startswith('INSERT')]), 1)
+
+    def test_load_subtree(self):
+        root_id = self.persist_tree()
+
+        with self.statements() as stmts:
+            root = ReservoirSeismicityPrediction.load_subtree(self.session,
+                                                              root_id)
+            nodes = list(root.walk())
+
+        self.assertEqual(len(stmts), 1)
+        self.assertEqual(nodes, preorder(root))
+        self.assertEqual(sorted(n.rate_value for n in nodes),
+                         list(range(2 ** (DEPTH + 1) - 1)))
+
+        self.assertIsNone(
+            ReservoirSeismicityPrediction.load_subtree(self.session, -1))
+
+    def test_join_depth(self):
+        root_id = self.persist_tree()
+
+        with self.statements() as stmts:
+            root = self.session.query(ReservoirSeismicityPrediction).get(
+                root_id)
+
+        # XXX(damb): A single SELECT ... IN per eagerly loaded level
+        self.assertEqual(len(stmts), 1 + 5)
+        self.assertFalse(root._subtree_loaded())
+
+        node = root
+        for _ in range(5):
+            node = node.children[0]
+        self.assertNotIn('children', node.__dict__)
+
+
+class SeismicityModelRunTestCase(test_db.GISDBTestCase):
+
+    def test_loader_options(self):
+        model = SeismicityModel(name='model', url='http://localhost')
+        self.session.add_all(
+            [SeismicityModelRun(model=model, result=create_tree(depth=1)),
+             SeismicityModelRun(model=model)])
+        self.session.commit()
+        self.session.expunge_all()
+
+        with self.statements() as stmts:
+            runs = self.session.query(SeismicityModelRun).\
+                options(*SeismicityModelRun.loader_options()).\
+                all()
+            [repr(run) for run in runs]
+            results = [run.result for run in runs]
+
+        # XXX(damb): runs (joined with models) and results
+        self.assertEqual(len(stmts), 2)
+        self.assertEqual(sum(r is not None for r in results), 1)
+        with self.assertRaises(InvalidRequestError):
+            runs[0].status
+        with self.assertRaises(InvalidRequestError):
+            runs[0].forecaststage
@@ -0,0 +1,274 @@
+# Copyright (C) 2019, ETH Zurich - Swiss Seismological Service SED
+"""
+Seismics related test facilities.
+"""
+
+import datetime
+import unittest
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import InvalidRequestError
+
+from ramsis.datamodel.status import Status  # noqa
+from ramsis.datamodel.seismicity import SeismicityModel  # noqa
+from ramsis.datamodel.forecast import Forecast  # noqa
+from ramsis.datamodel.seismics import SeismicCatalog, SeismicEvent
+from ramsis.datamodel.well import InjectionWell  # noqa
+from ramsis.datamodel.hydraulics import Hydraulics, InjectionPlan  # noqa
+from ramsis.datamodel.settings import ProjectSettings  # noqa
+from ramsis.datamodel.project import Project  # noqa
+from tests import test_db
+
+
+def create_events(num):
+    return [SeismicEvent(
+        quakeml=b'<event/>',
+        datetime_value=datetime.datetime(2019, 1, 1) +
+        datetime.timedelta(minutes=i),
+        x_value=0., y_value=0., z_value=0.,
+        magnitude_value=float(i)) for i in range(num)]
+
+
+class SeismicEventTestCase(unittest.TestCase):
+
+    def test_eq(self):
+        e0, e1 = create_events(2)
+        e2 = create_events(1)[0]
+
+        self.assertEqual(e0, e2)
+        self.assertNotEqual(e0, e1)
+        self.assertNotEqual(e0, None)
+
+        e2.quakeml = b'<event>foo</event>'
+        self.assertNotEqual(e0, e2)
+
+    def test_hash(self):
+        e0, e1 = create_events(2)
+        e1.quakeml = b'<event>foo</event>'
+        e2 = create_events(1)[0]
+
+        self.assertEqual(hash(e0), hash(e2))
+        self.assertEqual(len(set([e0, e1, e2])), 2)
+
+        e0.quakeml_digest = None
+        self.assertEqual(hash(e0), hash(e2))
+
+    def test_hash_without_quakeml(self):
+        e = SeismicEvent()
+        self.assertIsInstance(hash(e), int)
+        self.assertEqual(hash(e), hash(SeismicEvent()))
+
+    def test_copy(self):
+        e = create_events(1)[0]
+        e.seismiccatalog_id = 1
+
+        c = e.copy()
+        self.assertEqual(c, e)
+        self.assertIsNone(c.seismiccatalog_id)
+        self.assertEqual(e.copy(with_foreignkeys=True).seismiccatalog_id, 1)
+
+
+class SeismicCatalogTestCase(unittest.TestCase):
+
+    def test_snapshot(self):
+        events = create_events(4)
+        snap = SeismicCatalog(events=list(events)).snapshot()
+        self.assertEqual(snap.events, events)
+
+        events = create_events(4)
+        snap = SeismicCatalog(events=list(events)).snapshot(
+            lambda e: e.magnitude_value >= 2)
+        self.assertEqual(snap.events, events[2:])
+
+    def test_reduce(self):
+        events = create_events(4)
+        cat = SeismicCatalog(events=list(events))
+
+        cat.reduce(lambda e: e.magnitude_value >= 2)
+        self.assertEqual(cat.events, events[:2])
+
+        cat.reduce()
+        self.assertEqual(len(cat), 0)
+
+    def test_reduce_sql_transient(self):
+        cat = SeismicCatalog(events=create_events(2))
+
+        with self.assertRaises(ValueError):
+            cat.reduce(SeismicEvent.magnitude_value >= 1)
+
+    def test_events_between(self):
+        events = create_events(5)
+        cat = SeismicCatalog(events=list(events))
+
+        self.assertEqual(
+            cat.events_between(events[1].datetime_value,
+                               events[3].datetime_value),
+            events[1:4])
+        self.assertEqual(
+            cat.events_between(events[4].datetime_value +
+                               datetime.timedelta(seconds=1),
+                               events[4].datetime_value +
+                               datetime.timedelta(days=1)),
+            [])
+
+
+class SeismicCatalogDBTestCase(test_db.GISDBTestCase):
+
+    def persist_catalog(self, num=10):
+        cat = SeismicCatalog(events=create_events(num))
+        self.session.add(cat)
+        self.session.commit()
+        cat_id = cat.id
+        self.session.expunge_all()
+
+        return cat_id
+
+    def test_loader_options(self):
+        self.persist_catalog()
+
+        with self.statements() as stmts:
+            cat = self.session.query(SeismicCatalog).\
+                options(*SeismicCatalog.loader_options()).\
+                one()
+            self.assertEqual(len(cat), 10)
+
+        # XXX(damb): catalogs and events
+        self.assertEqual(len(stmts), 2)
+        with self.assertRaises(InvalidRequestError):
+            cat.project
+        with self.assertRaises(InvalidRequestError):
+            cat.events[0].seismiccatalog
+
+        self.session.expunge_all()
+        cat = self.session.query(SeismicCatalog).\
+            options(*SeismicCatalog.loader_options(with_events=False)).\
+            one()
+        with self.assertRaises(InvalidRequestError):
+            cat.events
+
+    def test_duplicate(self):
+        cat_id = self.persist_catalog()
+        cat = self.session.query(SeismicCatalog).get(cat_id)
+        cat.events[0].magnitude_value = -1.
+        cat.events.append(create_events(1)[0])
+
+        with self.statements() as stmts:
+            dup = cat.duplicate(self.session)
+        # XXX(damb): pending changes are flushed, events are copied by means
+        # of a single INSERT ... SELECT
+        inserts = [s for s in stmts
+                   if s.startswith('INSERT INTO seismicevent')]
+        self.assertEqual(len(inserts), 2)
+        self.session.commit()
+        dup_id = dup.id
+        self.session.expunge_all()
+
+        cat = self.session.query(SeismicCatalog).get(cat_id)
+        dup = self.session.query(SeismicCatalog).get(dup_id)
+        cat.load_quakeml(self.session)
+        dup.load_quakeml(self.session)
+
+        self.assertNotEqual(cat_id, dup_id)
+        self.assertEqual(len(dup), 11)
+        self.assertEqual(dup.events, cat.events)
+        self.assertEqual([e.quakeml for e in dup.events],
+                         [e.quakeml for e in cat.events])
+        self.assertEqual([e.quakeml_digest for e in dup.events],
+                         [e.quakeml_digest for e in cat.events])
+        self.assertTrue(
+            all(e.quakeml_digest is not None for e in dup.events))
+        self.assertFalse(set(e.id for e in dup.events) &
+                         set(e.id for e in cat.events))
+
+    def test_duplicate_criterion(self):
+        cat_id = self.persist_catalog()
+        cat = self.session.query(SeismicCatalog).get(cat_id)
+
+        dup = cat.duplicate(self.session,
+                            SeismicEvent.magnitude_value >= 5.)
+        self.session.commit()
+        dup_id = dup.id
+        self.session.expunge_all()
+
+        cat = self.session.query(SeismicCatalog).get(cat_id)
+        dup = self.session.query(SeismicCatalog).get(dup_id)
+        dup.load_quakeml(self.session)
+
+        self.assertEqual(len(cat), 10)
+        self.assertEqual([e.magnitude_value for e in dup.events],
+                         [5., 6., 7., 8., 9.])
+        self.assertEqual(dup.events, cat.events[5:])
+        self.assertTrue(all(e.quakeml == b'<event/>' for e in dup.events))
+
+    def test_reduce(self):
+        cat_id = self.persist_catalog()
+        cat = self.session.query(SeismicCatalog).get(cat_id)
+        cat.events.append(create_events(1)[0])
+
+        with self.session.no_autoflush, self.statements() as stmts:
+            cat.reduce()
+
+        self.assertEqual(
+            len([s for s in stmts if s.startswith('DELETE')]), 1)
+        self.session.commit()
+        self.session.expunge_all()
+
+        self.assertEqual(self.session.query(SeismicEvent).count(), 0)
+
+    def test_reduce_sql(self):
+        cat_id = self.persist_catalog()
+        cat = self.session.query(SeismicCatalog).get(cat_id)
+        # modified (matching) and pending (not matching) events
+        cat.events[9].magnitude_value = 0.
+        cat.events.append(create_events(6)[5])
+
+        with self.session.no_autoflush, self.statements() as stmts:
+            cat.reduce(SeismicEvent.magnitude_value < 5.)
+
+        self.assertEqual(
+            len([s for s in stmts if s.startswith('DELETE')]), 1)
+        self.assertEqual([e.magnitude_value for e in cat.events],
+                         [5., 5., 6., 7., 8.])
+        self.session.commit()
+        self.session.expunge_all()
+
+        self.assertEqual(self.session.query(SeismicEvent).count(), 5)
+
+    def test_len(self):
+        cat_id = self.persist_catalog()
+        cat = self.session.query(SeismicCatalog).\
+            options(*SeismicCatalog.loader_options(with_events=False)).\
+            get(cat_id)
+
+        with self.statements() as stmts:
+            self.assertEqual(len(cat), 10)
+            repr(cat)
+
+        self.assertEqual(len(stmts), 2)
+        self.assertTrue(all('count(' in s for s in stmts))
+        self.assertIn('events', inspect(cat).unloaded)
+
+    def test_copy_events(self):
+        cat_id = self.persist_catalog()
+        cat = self.session.query(SeismicCatalog).get(cat_id)
+
+        with self.statements() as stmts:
+            copies = [e.copy() for e in cat.events]
+
+        # XXX(damb): The deferred QuakeML is loaded by means of a single
+        # query.
+        self.assertEqual(len(stmts), 1)
+        self.assertEqual(copies, cat.events)
+        self.assertTrue(all(c.quakeml == b'<event/>' and
+                            c.quakeml_digest is not None for c in copies))
+
+    def test_load_quakeml(self):
+        cat_id = self.persist_catalog()
+        cat = self.session.query(SeismicCatalog).get(cat_id)
+        self.assertIn('quakeml', inspect(cat.events[0]).unloaded)
+
+        with self.statements() as stmts:
+            cat.load_quakeml(self.session)
+            [e.quakeml for e in cat.events]
+
+        self.assertEqual(len(stmts), 1)
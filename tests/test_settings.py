@@ -0,0 +1,78 @@
+# Copyright (C) 2019, ETH Zurich - Swiss Seismological Service SED
+"""
+Settings related test facilities.
+"""
+
+import datetime
+import unittest
+
+from ramsis.datamodel.status import Status  # noqa
+from ramsis.datamodel.seismicity import SeismicityModel  # noqa
+from ramsis.datamodel.forecast import Forecast  # noqa
+from ramsis.datamodel.seismics import SeismicCatalog  # noqa
+from ramsis.datamodel.well import InjectionWell  # noqa
+from ramsis.datamodel.hydraulics import Hydraulics, InjectionPlan  # noqa
+from ramsis.datamodel.settings import ProjectSettings, datetime_decoder
+from ramsis.datamodel.project import Project  # noqa
+
+
+class DatetimeDecoderTestCase(unittest.TestCase):
+
+    def test_decode(self):
+        dct = datetime_decoder({'dt': '2019-01-02 03:04:05',
+                                'invalid': '2019-13-02 03:04:05',
+                                'name': 'foo',
+                                'value': 1})
+
+        self.assertEqual(dct, {'dt': datetime.datetime(2019, 1, 2, 3, 4, 5),
+                               'invalid': '2019-13-02 03:04:05',
+                               'name': 'foo',
+                               'value': 1})
+
+
+class ProjectSettingsTestCase(unittest.TestCase):
+
+    def test_defaults(self):
+        settings = ProjectSettings()
+
+        self.assertIsNotNone(settings.config)
+        for key, default_value in ProjectSettings.DEFAULTS.items():
+            self.assertEqual(settings[key], default_value)
+
+    def test_commit_emits_on_change(self):
+        emitted = []
+        settings = ProjectSettings()
+        settings.settings_changed.connect(emitted.append)
+
+        settings.commit()
+        self.assertEqual(emitted, [])
+
+        settings['forecast_length'] = 12.0
+        settings.commit()
+        self.assertEqual(emitted, [settings])
+
+    def test_settings_changed_lazy(self):
+        settings = ProjectSettings()
+
+        self.assertNotIn('_settings_changed', settings.__dict__)
+        self.assertIs(settings.settings_changed, settings.settings_changed)
+
+    def test_forecast_start(self):
+        settings = ProjectSettings()
+        self.assertEqual(settings.forecast_start,
+                         ProjectSettings.DEFAULTS['forecast_start'])
+
+        forecast_start = datetime.datetime(2019, 1, 1)
+        settings['forecast_start'] = forecast_start
+        settings.commit()
+        self.assertEqual(settings.forecast_start, forecast_start)
+
+    def test_init_on_load(self):
+        settings = ProjectSettings()
+        settings['forecast_start'] = datetime.datetime(2019, 1, 1)
+        settings.commit()
+
+        settings.data = None
+        settings.init_on_load()
+        self.assertEqual(settings['forecast_start'],
+                         datetime.datetime(2019, 1, 1))
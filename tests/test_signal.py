@@ -0,0 +1,34 @@
+# Copyright (C) 2019, ETH Zurich - Swiss Seismological Service SED
+"""
+Signal related test facilities.
+"""
+
+import unittest
+
+from ramsis.datamodel.signal import Signal
+
+
+class SignalTestCase(unittest.TestCase):
+
+    def test_emit(self):
+        emitted = []
+        signal = Signal()
+        signal.connect(lambda x: emitted.append(('first', x)))
+        signal.connect(lambda x: emitted.append(('second', x)))
+
+        signal.emit(1)
+        self.assertEqual(emitted, [('first', 1), ('second', 1)])
+
+    def test_connect_once(self):
+        emitted = []
+        signal = Signal()
+        signal.connect(emitted.append)
+        signal.connect(emitted.append)
+
+        signal.emit(1)
+        self.assertEqual(emitted, [1])
+
+        signal.disconnect(emitted.append)
+        signal.disconnect(emitted.append)
+        signal.emit(2)
+        self.assertEqual(emitted, [1])
@@ -0,0 +1,39 @@
+# Copyright (C) 2019, ETH Zurich - Swiss Seismological Service SED
+"""
+Custom type related test facilities.
+"""
+
+import unittest
+import zlib
+
+from ramsis.datamodel.type import CompressedBinary
+
+
+class CompressedBinaryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.type_ = CompressedBinary()
+
+    def test_roundtrip(self):
+        value = b'<event>' + b'x' * 100 + b'</event>'
+        bound = self.type_.process_bind_param(value, None)
+
+        self.assertLess(len(bound), len(value))
+        self.assertEqual(self.type_.process_result_value(bound, None), value)
+        self.assertEqual(
+            self.type_.process_result_value(memoryview(bound), None), value)
+        self.assertIsNone(self.type_.process_bind_param(None, None))
+        self.assertIsNone(self.type_.process_result_value(None, None))
+
+    def test_legacy(self):
+        value = b'<?xml version="1.0"?><event/>'
+
+        self.assertEqual(self.type_.process_result_value(value, None), value)
+        self.assertEqual(
+            self.type_.process_result_value(memoryview(value), None), value)
+
+    def test_corrupt(self):
+        bound = self.type_.process_bind_param(b'<event/>' * 10, None)
+
+        with self.assertRaises(zlib.error):
+            self.type_.process_result_value(bound[:-4], None)
@@ -3,16 +3,40 @@
 Well related test facilities.
 """
 
+import datetime
 import unittest
 
+from sqlalchemy.exc import InvalidRequestError
+
 from ramsis.datamodel.status import Status  # noqa
 from ramsis.datamodel.seismicity import SeismicityModel  # noqa
 from ramsis.datamodel.forecast import Forecast  # noqa
 from ramsis.datamodel.seismics import SeismicCatalog, SeismicEvent  # noqa
 from ramsis.datamodel.well import InjectionWell, WellSection  # noqa
-from ramsis.datamodel.hydraulics import Hydraulics, InjectionPlan  # noqa
+from ramsis.datamodel.hydraulics import (Hydraulics, InjectionPlan,  # noqa
+                                         HydraulicSample)
 from ramsis.datamodel.settings import ProjectSettings  # noqa
 from ramsis.datamodel.project import Project  # noqa
+from tests import test_db
+
+
+# XXX(damb): Keyword arguments of linear well sections (top and bottom)
+TOP_SECTION = dict(toplongitude_value=8.925293642,
+                   toplatitude_value=46.90669014,
+                   topdepth_value=0,
+                   bottomlongitude_value=9,
+                   bottomlatitude_value=47,
+                   bottomdepth_value=500,
+                   holediameter_value=0.3,
+                   casingdiameter_value=0.25)
+BOTTOM_SECTION = dict(toplongitude_value=9,
+                      toplatitude_value=47,
+                      topdepth_value=500,
+                      bottomlongitude_value=9.01,
+                      bottomlatitude_value=47.01,
+                      bottomdepth_value=1500,
+                      holediameter_value=0.25,
+                      casingdiameter_value=0)
 
 
 class InjectionWellTestCase(unittest.TestCase):
@@ -20,95 +44,80 @@ class InjectionWellTestCase(unittest.TestCase):
     def test_longitude(self):
         reference_result = 8.925293642
         bh = InjectionWell()
-        s0 = WellSection(toplongitude_value=reference_result,
-                         toplatitude_value=46.90669014,
-                         topdepth_value=0,
-                         bottomlongitude_value=9,
-                         bottomlatitude_value=47,
-                         bottomdepth_value=500,
-                         holediameter_value=0.3,
-                         casingdiameter_value=0.25)
-        s1 = WellSection(toplongitude_value=9,
-                         toplatitude_value=47,
-                         topdepth_value=500,
-                         bottomlongitude_value=9.01,
-                         bottomlatitude_value=47.01,
-                         bottomdepth_value=1500,
-                         holediameter_value=0.25,
-                         casingdiameter_value=0)
-
-        bh.sections = [s0, s1]
+        bh.sections = [WellSection(**TOP_SECTION),
+                       WellSection(**BOTTOM_SECTION)]
 
         self.assertEqual(bh.longitude, reference_result)
 
     def test_latitude(self):
         reference_result = 46.90669014
         bh = InjectionWell()
-        s0 = WellSection(toplongitude_value=8.925293642,
-                         toplatitude_value=reference_result,
-                         topdepth_value=0,
-                         bottomlongitude_value=9,
-                         bottomlatitude_value=47,
-                         bottomdepth_value=500,
-                         holediameter_value=0.3,
-                         casingdiameter_value=0.25)
-        s1 = WellSection(toplongitude_value=9,
-                         toplatitude_value=47,
-                         topdepth_value=500,
-                         bottomlongitude_value=9.01,
-                         bottomlatitude_value=47.01,
-                         bottomdepth_value=1500,
-                         holediameter_value=0.25,
-                         casingdiameter_value=0)
-
-        bh.sections = [s0, s1]
+        bh.sections = [WellSection(**TOP_SECTION),
+                       WellSection(**BOTTOM_SECTION)]
 
         self.assertEqual(bh.latitude, reference_result)
 
     def test_depth(self):
         reference_result = 1500
         bh = InjectionWell()
-        s0 = WellSection(toplongitude_value=8.925293642,
-                         toplatitude_value=46.90669014,
-                         topdepth_value=0,
-                         bottomlongitude_value=9,
-                         bottomlatitude_value=47,
-                         bottomdepth_value=500,
-                         holediameter_value=0.3,
-                         casingdiameter_value=0.25)
-        s1 = WellSection(toplongitude_value=9,
-                         toplatitude_value=47,
-                         topdepth_value=500,
-                         bottomlongitude_value=9.01,
-                         bottomlatitude_value=47.01,
-                         bottomdepth_value=reference_result,
-                         holediameter_value=0.25,
-                         casingdiameter_value=0)
-
-        bh.sections = [s0, s1]
+        bh.sections = [WellSection(**TOP_SECTION),
+                       WellSection(**BOTTOM_SECTION)]
 
         self.assertEqual(bh.depth, reference_result)
 
     def test_injectionpoint(self):
         reference_result = (9, 47, 500)
         bh = InjectionWell()
-        s0 = WellSection(toplongitude_value=8.925293642,
-                         toplatitude_value=46.90669014,
-                         topdepth_value=0,
-                         bottomlongitude_value=9,
-                         bottomlatitude_value=47,
-                         bottomdepth_value=500,
-                         holediameter_value=0.3,
-                         casingdiameter_value=0.25)
-        s1 = WellSection(toplongitude_value=9,
-                         toplatitude_value=47,
-                         topdepth_value=500,
-                         bottomlongitude_value=9.01,
-                         bottomlatitude_value=47.01,
-                         bottomdepth_value=1500,
-                         holediameter_value=0.25,
-                         casingdiameter_value=0)
-
-        bh.sections = [s0, s1]
+        bh.sections = [WellSection(**TOP_SECTION),
+                       WellSection(**BOTTOM_SECTION)]
 
         self.assertEqual(bh.injectionpoint, reference_result)
+
+    def test_no_sections(self):
+        bh = InjectionWell()
+
+        self.assertIsNone(bh.longitude)
+        self.assertIsNone(bh.latitude)
+        self.assertIsNone(bh.depth)
+
+    def test_extrema(self):
+        bh = InjectionWell()
+        self.assertEqual(bh._extrema(), (None, None))
+
+        s0 = WellSection(**TOP_SECTION)
+        s1 = WellSection(**BOTTOM_SECTION)
+        bh.sections = [s1, s0]
+
+        self.assertEqual(bh._extrema(), (s0, 1500))
+
+
+class InjectionWellDBTestCase(test_db.GISDBTestCase):
+
+    def test_loader_options(self):
+        dt = datetime.datetime(2019, 1, 1)
+        samples = [HydraulicSample(datetime_value=dt)]
+        self.session.add(InjectionWell(sections=[
+            WellSection(hydraulics=Hydraulics(samples=samples),
+                        injectionplan=InjectionPlan(), **TOP_SECTION),
+            WellSection(**BOTTOM_SECTION)]))
+        self.session.commit()
+        self.session.expunge_all()
+
+        with self.statements() as stmts:
+            well = self.session.query(InjectionWell).\
+                options(*InjectionWell.loader_options()).\
+                one()
+            repr(well)
+            sections = sorted(well.sections, key=lambda s: s.topdepth_value)
+            hydraulics = sections[0].hydraulics
+            injectionplan = sections[0].injectionplan
+
+        # XXX(damb): wells and sections (joined with hydraulics and injection
+        # plans)
+        self.assertEqual(len(stmts), 2)
+        self.assertIsNotNone(hydraulics)
+        self.assertIsNotNone(injectionplan)
+        self.assertIsNone(sections[1].hydraulics)
+
+        with self.assertRaises(InvalidRequestError):
+            hydraulics.samples